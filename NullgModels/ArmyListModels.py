@@ -53,15 +53,15 @@ class ArmyListMember(NullGBaseModel):
         members (list[ArmyUnitMember]): Units in this element.
     """
     name: str = Field(description="", default="")
-    specialAbilities: List[str] = Field(description="", default=[])
+    specialAbilities: List[str] = Field(description="", default_factory=list)
     type: str = Field(description="", default="")
     formationType: str = Field(description="", default="")
     pointsType: str = Field(description="", default="")
     pointsTotal: str = Field(description="", default="")
-    customFields: List[str] = Field(description="", default=[])
+    customFields: List[str] = Field(description="", default_factory=list)
     experience: str = Field(description="")
     techRating: str = Field(description="")
-    members: List[ArmyUnitMember] = Field(description="", default=[])
+    members: List[ArmyUnitMember] = Field(description="", default_factory=list)
 
 
 class ArmyList(NullGBaseModel):
@@ -95,11 +95,11 @@ class ArmyList(NullGBaseModel):
     points: str = Field(description="", default="")
     pointsType: str = Field(description="", default="")
     experience: str = Field(description="", default="")
-    abilities: List[str] = Field(description="", default=[])
+    abilities: List[str] = Field(description="", default_factory=list)
     type: str = Field(description="", default="")
     combatCommand: str = Field(description="", default="")
     addNotes: bool = Field(description="", default=False)
     rsType: RecordSheetType = Field(description="", default=RecordSheetType.none)
     format: str = Field(description="", default="")
     techRating: str = Field(description="", default="")
-    members: List[ArmyListMember] = Field(description="", default=[])
\ No newline at end of file
+    members: List[ArmyListMember] = Field(description="", default_factory=list)
\ No newline at end of file
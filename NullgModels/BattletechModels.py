@@ -5,7 +5,7 @@ from pydantic import Field, field_validator, ValidationInfo
 from NullgModels.AlphaStrikeModels import AlphaStrikeData
 from NullgModels.Constants import *
 from NullgModels.PilotModels import PilotData
-from NullgModels.NullGBaseModels import NullGBaseModel
+from NullgModels.NullGBaseModels import InternedStr, NullGBaseModel
 from NullgModels.NullGEnums import UnitType, UnitSubtype, RoleType, WeightClassType, RulesLevelType, UnitCategoryType
 from NullgModels.TotalWarModels import TotalWarDropshipData, TotalWarInfantryData, TotalWarAerospaceData, \
     TotalWarBattleMechData, TotalWarVehicleData, TotalWarDropshipExtendedData, TotalWarInfantryExtendedData, \
@@ -224,7 +224,7 @@ class UnitData(NullGBaseModel):
     version: Optional[float] = Field(description="Version of the unit document", default=None)
     bv: Optional[float] = Field(description="Battle Value v2", default=None)
     pv: Optional[int] = Field(description="Alpha Strike points value", default=None)
-    techbase: Optional[str] = Field(description="Unit overall technology base", default=None)
+    techbase: Optional[InternedStr] = Field(description="Unit overall technology base", default=None)
     mulId: Optional[int] = Field(description="The corresponding Master Unit List Id", default=None)
     weightClass: Optional[WeightClassType] = Field(description="Weight Class Id", default=None)
     role: Optional[RoleType] = Field(description="Unit role Id", default=None)
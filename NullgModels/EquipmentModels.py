@@ -1,13 +1,27 @@
 ## Equipment BaseModels
-from typing import Optional, List, Union, Dict
-
-from pydantic import Field, field_validator, ValidationInfo, BaseModel
+# Performance: these are model definitions with no numeric loops, so the cost is object
+# allocation and per-field validation, not arithmetic. Vectorisation (SIMD, NumPy, GPU)
+# does not apply here. What has helped: flag views and int bitmask input on the flag
+# models, immutable Alpha Strike tuple defaults and the tagged item union. Skipping
+# validation does not: pydantic-core validates these models faster than Python can build
+# them with model_construct. Further work belongs in the same places: fewer allocated
+# objects per item and less per-field validation work.
+from enum import IntFlag
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Union, Dict, Any, Annotated, Tuple, ClassVar, Mapping
+
+from pydantic import Field, field_validator, model_validator, ValidationInfo, Discriminator, Tag
 
 from NullgModels.Constants import FIELD_EQUIPMENT_TYPE
-from NullgModels.NullGBaseModels import NullGBaseModel
+from NullgModels.NullGBaseModels import InternedStr, NullGBaseModel
 from NullgModels.NullGEnums import EquipmentType, TechbaseType, UnitSubtype
 
 
+# Examples shared by every bool flag field instead of a new list per field.
+_BOOL_EXAMPLES = [True, False]
+
+
 class EquipmentWeaponDamage(NullGBaseModel):
     """
     Defines damage values for weapons across standard BattleTech range brackets
@@ -58,114 +72,163 @@ class EquipmentAlphaStrike(NullGBaseModel):
         tc: Can this use a Targeting Computer
         specials: List of special abilities conferred by this equipment
     """
-    extreme: Optional[List[float]] = Field(description="Extreme range damage values", default=[0.0,0.0,0.0])
-    long: Optional[List[float]] = Field(description="Long range damage values", default=[0.0,0.0,0.0])
-    medium: Optional[List[float]] = Field(description="Medium range damage values", default=[0.0,0.0,0.0])
-    short: Optional[List[float]] = Field(description="Short range damage values", default=[0.0,0.0,0.0])
-    artillery: Optional[List[float]] = Field(description="Artillery damage values", default=[0.0,0.0,0.0])
+    extreme: Optional[Tuple[float, ...]] = Field(description="Extreme range damage values", default=(0.0, 0.0, 0.0))
+    long: Optional[Tuple[float, ...]] = Field(description="Long range damage values", default=(0.0, 0.0, 0.0))
+    medium: Optional[Tuple[float, ...]] = Field(description="Medium range damage values", default=(0.0, 0.0, 0.0))
+    short: Optional[Tuple[float, ...]] = Field(description="Short range damage values", default=(0.0, 0.0, 0.0))
+    artillery: Optional[Tuple[float, ...]] = Field(description="Artillery damage values", default=(0.0, 0.0, 0.0))
     radius: Optional[int] = Field(description="Radius of artillery damage values", default=0)
     tc: Optional[bool] = Field(description="Can this use a Targeting Computer", default=False)
-    specials: Optional[List[str]] = Field(
+    specials: Optional[Tuple[str, ...]] = Field(
         description="List of specials abilities conferred by this equipment",
-        default=[]
+        default=()
     )
 
 
-class EquipmentTypeData(BaseModel):
+class _FlagsModel(NullGBaseModel):
+    """
+    Base for models made up only of bool flags. The flags can also be given and read as a
+    single packed bitmask, see _bind_flags.
+    """
+    _flagType: ClassVar[type[IntFlag]] = IntFlag
+    _flagBits: ClassVar[Tuple[Tuple[str, int], ...]] = ()
+
+    @model_validator(mode='before')
+    @classmethod
+    def validate_flags(cls, v: Any):
+        """Accept the flags packed into a single bitmask."""
+        if isinstance(v, int) and not isinstance(v, bool):
+            if v < 0 or v >> len(cls._flagBits):
+                raise ValueError(f'Flags bitmask {v} is outside the {len(cls._flagBits)} defined flags')
+            return {name: bool(v & bit) for name, bit in cls._flagBits}
+        return v
+
+    @property
+    def flags(self) -> IntFlag:
+        """
+        All the flags packed into a single bitmask, so several characteristics can be
+        checked at once, e.g. `(flags & mask) == mask`.
+        """
+        values = self.__dict__
+        flags = 0
+        for name, bit in self._flagBits:
+            if values[name]:
+                flags |= bit
+        return self._flagType(flags)
+
+
+def _bind_flags(modelClass: type[_FlagsModel], name: str) -> type[IntFlag]:
+    """Create the IntFlag with one bit per field of a flags model and attach it to the model."""
+    flagType = IntFlag(name, list(modelClass.model_fields))
+    modelClass._flagType = flagType
+    modelClass._flagBits = tuple((flag.name, flag.value) for flag in flagType)
+    return flagType
+
+
+class EquipmentTypeData(_FlagsModel):
     """
     Data class for equipment type information.
 
     Key characteristics about the equipment.
     """
-    isBeagleActiveProbe: bool = Field(description="is function as a Beagle Active Probe", default=False, examples=[True, False])
-    isInfantryEncumbered: bool = Field(description="Does this encumber infantry", default=False, examples=[True, False])
-    isECM: bool = Field(description="Does this function as an ECM device", default=False, examples=[True, False])
-    isAngelECM: bool = Field(description="Does this function as an Angel ECM", default=False, examples=[True, False])
-    isWatchdog: bool = Field(description="Does this function as a Watch dog device", default=False, examples=[True, False])
-    isNOVA: bool = Field(description="does this function as a NOVA device", default=False, examples=[True, False])
-    isBloodhound: bool = Field(description="does this function as a Bloodhound device", default=False, examples=[True, False])
-    isEWEquipment: bool = Field(description="does this function as a Electronic Warfare equipment, not a full ECM suite", default=False, examples=[True, False])
-    isMiscType: bool = Field(description="is this a Miscellaneous device", default=False, examples=[True, False])
-    isBAManipulator: bool = Field(description="is this a Battle Armor Manipulator", default=False, examples=[True, False])
-    isTAG: bool = Field(description="does this item provide TAG functionality", default=False, examples=[True, False])
-    isDefensive: bool = Field(description="Is this considered defensive equipment", default=False, examples=[True, False])
-    isDisplayed: bool = Field(description="Show this be displayed on a record sheet", default=False, examples=[True, False])
-    isEditable: bool = Field(description="Is this an editable critical slot", default=False, examples=[True, False])
-    isEquipment: bool = Field(description="Is this a Equipment verse a weapon", default=False, examples=[True, False])
-    isExplosive: bool = Field(description="Is Explosive", default=False, examples=[True, False])
-    isFixed: bool = Field(description="Are the critical slots fixed and cannot be move around", default=False, examples=[True, False])
-    isHittable: bool = Field(description="Are these critical slots damagable", default=False, examples=[True, False])
-    isLPMEnabled: bool = Field(description="Can a Pulse Laser Modular be used", default=False, examples=[True, False])
-    isLegAttack: bool = Field(description="Does this confer the Leg Attack ability", default=False, examples=[True, False])
-    isMechanized: bool = Field(description="Does this confer the Mechanized ability", default=False, examples=[True, False])
-    isMelee: bool = Field(description="Is this a melee verse ranged weapon", default=False, examples=[True, False])
+    isBeagleActiveProbe: bool = Field(description="is function as a Beagle Active Probe", default=False, examples=_BOOL_EXAMPLES)
+    isInfantryEncumbered: bool = Field(description="Does this encumber infantry", default=False, examples=_BOOL_EXAMPLES)
+    isECM: bool = Field(description="Does this function as an ECM device", default=False, examples=_BOOL_EXAMPLES)
+    isAngelECM: bool = Field(description="Does this function as an Angel ECM", default=False, examples=_BOOL_EXAMPLES)
+    isWatchdog: bool = Field(description="Does this function as a Watch dog device", default=False, examples=_BOOL_EXAMPLES)
+    isNOVA: bool = Field(description="does this function as a NOVA device", default=False, examples=_BOOL_EXAMPLES)
+    isBloodhound: bool = Field(description="does this function as a Bloodhound device", default=False, examples=_BOOL_EXAMPLES)
+    isEWEquipment: bool = Field(description="does this function as a Electronic Warfare equipment, not a full ECM suite", default=False, examples=_BOOL_EXAMPLES)
+    isMiscType: bool = Field(description="is this a Miscellaneous device", default=False, examples=_BOOL_EXAMPLES)
+    isBAManipulator: bool = Field(description="is this a Battle Armor Manipulator", default=False, examples=_BOOL_EXAMPLES)
+    isTAG: bool = Field(description="does this item provide TAG functionality", default=False, examples=_BOOL_EXAMPLES)
+    isDefensive: bool = Field(description="Is this considered defensive equipment", default=False, examples=_BOOL_EXAMPLES)
+    isDisplayed: bool = Field(description="Show this be displayed on a record sheet", default=False, examples=_BOOL_EXAMPLES)
+    isEditable: bool = Field(description="Is this an editable critical slot", default=False, examples=_BOOL_EXAMPLES)
+    isEquipment: bool = Field(description="Is this a Equipment verse a weapon", default=False, examples=_BOOL_EXAMPLES)
+    isExplosive: bool = Field(description="Is Explosive", default=False, examples=_BOOL_EXAMPLES)
+    isFixed: bool = Field(description="Are the critical slots fixed and cannot be move around", default=False, examples=_BOOL_EXAMPLES)
+    isHittable: bool = Field(description="Are these critical slots damagable", default=False, examples=_BOOL_EXAMPLES)
+    isLPMEnabled: bool = Field(description="Can a Pulse Laser Modular be used", default=False, examples=_BOOL_EXAMPLES)
+    isLegAttack: bool = Field(description="Does this confer the Leg Attack ability", default=False, examples=_BOOL_EXAMPLES)
+    isMechanized: bool = Field(description="Does this confer the Mechanized ability", default=False, examples=_BOOL_EXAMPLES)
+    isMelee: bool = Field(description="Is this a melee verse ranged weapon", default=False, examples=_BOOL_EXAMPLES)
     isMisc: bool = Field(
-        description="Is this miscellaneous equipment, does not count as a weapon or defensive", default=False, examples=[True, False])
-    isPair: bool = Field(description="Does this come in pairs, like claws or talons", default=False, examples=[True, False])
-    isSingleHex: bool = Field(description="Single Hex range", default=False, examples=[True, False])
-    isSwarmAttack: bool = Field(description="Does this confer the Swam Attack ability", default=False, examples=[True, False])
+        description="Is this miscellaneous equipment, does not count as a weapon or defensive", default=False, examples=_BOOL_EXAMPLES)
+    isPair: bool = Field(description="Does this come in pairs, like claws or talons", default=False, examples=_BOOL_EXAMPLES)
+    isSingleHex: bool = Field(description="Single Hex range", default=False, examples=_BOOL_EXAMPLES)
+    isSwarmAttack: bool = Field(description="Does this confer the Swam Attack ability", default=False, examples=_BOOL_EXAMPLES)
     isTrackedEquipment: bool = Field(description="Does this item get tracked on the record sheet",
-                                               default=False, examples=[True, False])
-    isTurret: bool = Field(description="Is this a turret", default=False, examples=[True, False])
-    isUnique: bool = Field(description="Is this item limited to 1", default=False, examples=[True, False])
-    isVariable: bool = Field(description="Deos this have variable damage", default=False, examples=[True, False])
+                                               default=False, examples=_BOOL_EXAMPLES)
+    isTurret: bool = Field(description="Is this a turret", default=False, examples=_BOOL_EXAMPLES)
+    isUnique: bool = Field(description="Is this item limited to 1", default=False, examples=_BOOL_EXAMPLES)
+    isVariable: bool = Field(description="Deos this have variable damage", default=False, examples=_BOOL_EXAMPLES)
     isVariableCrit: bool = Field(description="Does this equipment have variable critical slot count",
-                                           default=False, examples=[True, False])
-    isVariableMass: bool = Field(description="Does this equipment have variable mass", default=False, examples=[True, False])
-    isWeapon: bool = Field(description="Is the considered a weapon", default=False, examples=[True, False])
+                                           default=False, examples=_BOOL_EXAMPLES)
+    isVariableMass: bool = Field(description="Does this equipment have variable mass", default=False, examples=_BOOL_EXAMPLES)
+    isWeapon: bool = Field(description="Is the considered a weapon", default=False, examples=_BOOL_EXAMPLES)
 
 
-class WeaponClassification(BaseModel):
+# One bit per EquipmentTypeData field, in declaration order.
+EquipmentTypeFlag = _bind_flags(EquipmentTypeData, "EquipmentTypeFlag")
+
+
+class WeaponClassification(_FlagsModel):
     """
     A collection of boolean flags categorizing weapons by their type (Ballistic, Energy, Missile),
     technology base (Pulse, Ultra, Streak), and special rules (Indirect, Rapid Fire).
 
     Attributes:
     """
-    isInfantryBurst: bool = Field(description="Is consider burst weapon against infantry", default=False, examples=[True, False])
-    isInfantryNonPen: bool = Field(description="Does this count as non-penetrating against infantry", default=False, examples=[True, False])
-    isInfantryWeapon: bool = Field(description="Does this count as an infantry", default=False, examples=[True, False])
-    isMML: bool = Field(description="", default=False, examples=[True, False])
-    isATM: bool = Field(description="", default=False, examples=[True, False])
-    isISCenturionWeaponSystem: bool = Field(description="", default=False, examples=[True, False])
-    isLRT: bool = Field(description="", default=False, examples=[True, False])
-    isSRT: bool = Field(description="", default=False, examples=[True, False])
-    isSRM: bool = Field(description="", default=False, examples=[True, False])
-    isLRM: bool = Field(description="", default=False, examples=[True, False])
-    isMRM: bool = Field(description="", default=False, examples=[True, False])
-    isLBX: bool = Field(description="", default=False, examples=[True, False])
-    isUltra: bool = Field(description="", default=False, examples=[True, False])
-    isRotary: bool = Field(description="", default=False, examples=[True, False])
-    isRocketLauncher: bool = Field(description="", default=False, examples=[True, False])
-    isAERO: bool = Field(description="", default=False, examples=[True, False])
-    isStreak: bool = Field(description="", default=False, examples=[True, False])
-    isiATM: bool = Field(description="", default=False, examples=[True, False])
-    isAMS: bool = Field(description="Is the an Anti-Missile System", default=False, examples=[True, False])
-    isAntiAir: bool = Field(description="Is this Anti-Air", default=False, examples=[True, False])
-    isAntiInfantry: bool = Field(description="Is this Anti-Infantry", default=False, examples=[True, False])
-    isApolloEnabled: bool = Field(description="Can an Apollo MRM FCS be used", default=False, examples=[True, False])
-    isArtemisEnabled: bool = Field(description="Can an Artemis (IV, V) be used", default=False, examples=[True, False])
-    isArtillery: bool = Field(description="Is this an artillery piece", default=False, examples=[True, False])
-    isArtilleryCannon: bool = Field(description="Is the an artillery cannon", default=False, examples=[True, False])
-    isBallistic: bool = Field(description="Is this a Ballistic type weapon", default=False, examples=[True, False])
-    isCapital: bool = Field(description="Is this a capital weapon", default=False, examples=[True, False])
-    isCluster: bool = Field(description="Is this a cluster weapon", default=False, examples=[True, False])
-    isDirect: bool = Field(description="Is this a Direct fire weapon", default=False, examples=[True, False])
-    isEnergy: bool = Field(description="Is this an Energy weapon", default=False, examples=[True, False])
-    isFlame: bool = Field(description="Is Flame weapon", default=False, examples=[True, False])
-    isHeatCausing: bool = Field(description="Is Heat causing, example plasma", default=False, examples=[True, False])
-    isHeavyWeapon: bool = Field(description="Is this a heavy weapon for infantry", default=False, examples=[True, False])
-    isIndirect: bool = Field(description="Is this indirect", default=False, examples=[True, False])
-    isPhysical: bool = Field(description="Is this a physical weapon like Swords", default=False, examples=[True, False])
-    isPulse: bool = Field(description="Is this a pulse weapon", default=False, examples=[True, False])
+    isInfantryBurst: bool = Field(description="Is consider burst weapon against infantry", default=False, examples=_BOOL_EXAMPLES)
+    isInfantryNonPen: bool = Field(description="Does this count as non-penetrating against infantry", default=False, examples=_BOOL_EXAMPLES)
+    isInfantryWeapon: bool = Field(description="Does this count as an infantry", default=False, examples=_BOOL_EXAMPLES)
+    isMML: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isATM: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isISCenturionWeaponSystem: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isLRT: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isSRT: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isSRM: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isLRM: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isMRM: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isLBX: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isUltra: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isRotary: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isRocketLauncher: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isAERO: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isStreak: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isiATM: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    isAMS: bool = Field(description="Is the an Anti-Missile System", default=False, examples=_BOOL_EXAMPLES)
+    isAntiAir: bool = Field(description="Is this Anti-Air", default=False, examples=_BOOL_EXAMPLES)
+    isAntiInfantry: bool = Field(description="Is this Anti-Infantry", default=False, examples=_BOOL_EXAMPLES)
+    isApolloEnabled: bool = Field(description="Can an Apollo MRM FCS be used", default=False, examples=_BOOL_EXAMPLES)
+    isArtemisEnabled: bool = Field(description="Can an Artemis (IV, V) be used", default=False, examples=_BOOL_EXAMPLES)
+    isArtillery: bool = Field(description="Is this an artillery piece", default=False, examples=_BOOL_EXAMPLES)
+    isArtilleryCannon: bool = Field(description="Is the an artillery cannon", default=False, examples=_BOOL_EXAMPLES)
+    isBallistic: bool = Field(description="Is this a Ballistic type weapon", default=False, examples=_BOOL_EXAMPLES)
+    isCapital: bool = Field(description="Is this a capital weapon", default=False, examples=_BOOL_EXAMPLES)
+    isCluster: bool = Field(description="Is this a cluster weapon", default=False, examples=_BOOL_EXAMPLES)
+    isDirect: bool = Field(description="Is this a Direct fire weapon", default=False, examples=_BOOL_EXAMPLES)
+    isEnergy: bool = Field(description="Is this an Energy weapon", default=False, examples=_BOOL_EXAMPLES)
+    isFlame: bool = Field(description="Is Flame weapon", default=False, examples=_BOOL_EXAMPLES)
+    isHeatCausing: bool = Field(description="Is Heat causing, example plasma", default=False, examples=_BOOL_EXAMPLES)
+    isHeavyWeapon: bool = Field(description="Is this a heavy weapon for infantry", default=False, examples=_BOOL_EXAMPLES)
+    isIndirect: bool = Field(description="Is this indirect", default=False, examples=_BOOL_EXAMPLES)
+    isPhysical: bool = Field(description="Is this a physical weapon like Swords", default=False, examples=_BOOL_EXAMPLES)
+    isPulse: bool = Field(description="Is this a pulse weapon", default=False, examples=_BOOL_EXAMPLES)
     isRapidFire: bool = Field(description="Does this fire multiple 'shots' like Ultra/Rotary ACs",
-                                        default=False, examples=[True, False])
-    isMissile: bool = Field(description="Is this a missile type", default=False, examples=[True, False])
-    isOneShot: bool = Field(description="Is this a one-shot weapon", default=False, examples=[True, False])
-    isPPCCapacitorEnabled: bool = Field(description="Can a PPC Capacitor be paired", default=False, examples=[True, False])
-    isSubCapital: bool = Field(description="Is this Sub-capital", default=False, examples=[True, False])
-    isSwitchable: bool = Field(description="", default=False, examples=[True, False])
-    useTargetingComputer: bool = Field(description="Can this use a targeting computer", default=False, examples=[True, False])
+                                        default=False, examples=_BOOL_EXAMPLES)
+    isMissile: bool = Field(description="Is this a missile type", default=False, examples=_BOOL_EXAMPLES)
+    isOneShot: bool = Field(description="Is this a one-shot weapon", default=False, examples=_BOOL_EXAMPLES)
+    isPPCCapacitorEnabled: bool = Field(description="Can a PPC Capacitor be paired", default=False, examples=_BOOL_EXAMPLES)
+    isSubCapital: bool = Field(description="Is this Sub-capital", default=False, examples=_BOOL_EXAMPLES)
+    isSwitchable: bool = Field(description="", default=False, examples=_BOOL_EXAMPLES)
+    useTargetingComputer: bool = Field(description="Can this use a targeting computer", default=False, examples=_BOOL_EXAMPLES)
+
+
+# One bit per WeaponClassification field, in declaration order.
+WeaponClassificationFlag = _bind_flags(WeaponClassification, "WeaponClassificationFlag")
+
 
 class BaseEquipmentItem(NullGBaseModel):
     """
@@ -196,7 +259,7 @@ class WeaponItem(BaseEquipmentItem):
     """
     canSplit: Optional[bool] = Field(description="", default=None)
     clusterSize: Optional[int] = Field(description="", default=None)
-    bayType: Optional[str] = Field(description="", default=None)
+    bayType: Optional[InternedStr] = Field(description="", default=None)
     crew: Optional[int] = Field(description="", default=None)
     damage: Optional[EquipmentWeaponDamage] = Field(description="", default=None)
     ranges: Optional[EquipmentWeaponRanges] = Field(description="", default=None)
@@ -230,7 +293,7 @@ class OtherItem(BaseEquipmentItem):
     Attributes:
         bayType: The type of bay.
     """
-    bayType: Optional[str] = Field(description="", default=None)
+    bayType: Optional[InternedStr] = Field(description="", default=None)
 
 
 class CockpitItem(BaseEquipmentItem):
@@ -243,7 +306,7 @@ class CockpitItem(BaseEquipmentItem):
         cockpitType: The type of cockpit (Standard, Advanced, Expert).
     """
     bvModifier: Optional[float] = Field(description="", default=None)
-    cockpitType: Optional[str] = Field(description="", default=None)
+    cockpitType: Optional[InternedStr] = Field(description="", default=None)
 
 
 class EnhancementItem(BaseEquipmentItem):
@@ -266,7 +329,7 @@ class WeaponBayItem(BaseEquipmentItem):
         mediumRange: The maximum medium range for the bay.
         shortRange: The maximum short range for the bay.
     """
-    bayType: Optional[str] = Field(description="", default=None)
+    bayType: Optional[InternedStr] = Field(description="", default=None)
     damage: Optional[dict] = Field(description="", default=None)
     heat: Optional[int] = Field(description="", default=None)
     longRange: Optional[int] = Field(description="", default=None)
@@ -289,9 +352,9 @@ class ArmorItem(BaseEquipmentItem):
     """
     bvModifier: Optional[float] = Field(description="", default=1.0, examples=[1.0, 1.5, 2.0])
     armorPointsModifier: Optional[float] = Field(description="", default=1.0, examples=[1.0, 1.5, 2.0])
-    armorType: Optional[str] = Field(description="", default="standard", examples=["standard", "special"])
+    armorType: Optional[InternedStr] = Field(description="", default="standard", examples=["standard", "special"])
     displayOrder: Optional[int] = Field(description="", default=0, examples=[1, 2, 4])
-    spreadable: Optional[bool] = Field(description="", default=False, examples=[True, False])
+    spreadable: Optional[bool] = Field(description="", default=False, examples=_BOOL_EXAMPLES)
     damageDivisor: Optional[float] = Field(description="", default=1.0, examples=[1.0, 1.5, 2.0])
 
 
@@ -304,7 +367,7 @@ class MyomerItem(BaseEquipmentItem):
         myomerType: The type of myomer (MASC, TSM).
     """
     massDivisor: Optional[int] = Field(description="", default=None)
-    myomerType: Optional[str] = Field(description="", default=None)
+    myomerType: Optional[InternedStr] = Field(description="", default=None)
 
 
 class ManipulatorItem(BaseEquipmentItem):
@@ -337,7 +400,7 @@ class StructureItem(BaseEquipmentItem):
     """
     bvModifier: Optional[float] = Field(description="", default=None)
     massModifier: Optional[float] = Field(description="", default=None)
-    structureType: Optional[str] = Field(description="", default=None)
+    structureType: Optional[InternedStr] = Field(description="", default=None)
 
 
 class EngineItem(BaseEquipmentItem):
@@ -375,7 +438,7 @@ class GyroItem(BaseEquipmentItem):
     """
     bvModifier: Optional[float] = Field(description="", default=None)
     displayName: Optional[str] = Field(description="", default=None)
-    gyroType: Optional[str] = Field(description="", default=None)
+    gyroType: Optional[InternedStr] = Field(description="", default=None)
     massModifier: Optional[float] = Field(description="", default=None)
 
 
@@ -411,6 +474,77 @@ class AmmoItem(BaseEquipmentItem):
     shots: Optional[float] = Field(description="", default=None)
 
 
+# Maps each equipment type to the model used for its item data. Built once at
+# import so the item validator only has to do a single lookup per record. The keys
+# are IntEnum members, so raw integer ids look up the same entries. Read-only, since
+# item_class_for caches its lookups.
+EQUIPMENT_TYPE_MAP: Mapping[EquipmentType, type[BaseEquipmentItem]] = MappingProxyType({
+    EquipmentType.weapon: WeaponItem,
+    EquipmentType.other: OtherItem,
+    EquipmentType.armor: ArmorItem,
+    EquipmentType.cockpit: CockpitItem,
+    EquipmentType.structure: StructureItem,
+    EquipmentType.engine: EngineItem,
+    EquipmentType.conversion: ConversionItem,
+    EquipmentType.manipulator: ManipulatorItem,
+    EquipmentType.gyro: GyroItem,
+    EquipmentType.ammo: AmmoItem,
+    EquipmentType.heatsink: HeatSinkItem,
+    EquipmentType.bay: BayItem,
+    EquipmentType.myomer: MyomerItem,
+    EquipmentType.enhancement: EnhancementItem,
+    EquipmentType.weaponbay: WeaponBayItem,
+})
+
+
+@lru_cache(maxsize=None)
+def item_class_for(equipmentType: int) -> type[BaseEquipmentItem]:
+    """
+    Resolve the item model for an equipment type id.
+
+    Raises:
+        ValueError: If the id is not a known equipment type.
+    """
+    itemClass = EQUIPMENT_TYPE_MAP.get(equipmentType)
+    if itemClass is None:
+        raise ValueError('Invalid equipment type')
+    return itemClass
+
+
+_ITEM_TAGS = {itemClass: equipmentType.name for equipmentType, itemClass in EQUIPMENT_TYPE_MAP.items()}
+
+
+def _item_tag(v: Any) -> Optional[str]:
+    """Tag item data by the equipment type of its model, or of the nearest base for subclasses."""
+    for itemClass in type(v).__mro__:
+        tag = _ITEM_TAGS.get(itemClass)
+        if tag is not None:
+            return tag
+    return None
+
+
+# The equipment type lives on the parent EquipmentItem, so validate_item_type picks the
+# model and the union is tagged by that model, letting pydantic jump straight to the
+# matching member instead of trying each one in turn.
+EquipmentItemData = Annotated[Union[
+    Annotated[WeaponItem, Tag(EquipmentType.weapon.name)],
+    Annotated[OtherItem, Tag(EquipmentType.other.name)],
+    Annotated[CockpitItem, Tag(EquipmentType.cockpit.name)],
+    Annotated[AmmoItem, Tag(EquipmentType.ammo.name)],
+    Annotated[HeatSinkItem, Tag(EquipmentType.heatsink.name)],
+    Annotated[BayItem, Tag(EquipmentType.bay.name)],
+    Annotated[GyroItem, Tag(EquipmentType.gyro.name)],
+    Annotated[EngineItem, Tag(EquipmentType.engine.name)],
+    Annotated[StructureItem, Tag(EquipmentType.structure.name)],
+    Annotated[ConversionItem, Tag(EquipmentType.conversion.name)],
+    Annotated[ArmorItem, Tag(EquipmentType.armor.name)],
+    Annotated[ManipulatorItem, Tag(EquipmentType.manipulator.name)],
+    Annotated[MyomerItem, Tag(EquipmentType.myomer.name)],
+    Annotated[WeaponBayItem, Tag(EquipmentType.weaponbay.name)],
+    Annotated[EnhancementItem, Tag(EquipmentType.enhancement.name)],
+], Discriminator(_item_tag)]
+
+
 class EquipmentItem(NullGBaseModel):
     """
     The primary container for an equipment entry, aggregating metadata, classification flags,
@@ -419,7 +553,7 @@ class EquipmentItem(NullGBaseModel):
     id: Optional[str] = Field(description="", default=None)
     equipmentType: Optional[EquipmentType] = Field(description="", default=None)
     name: Optional[str] = Field(description="", default=None)
-    techRating: Optional[str] = Field(description="", default=None)
+    techRating: Optional[InternedStr] = Field(description="", default=None)
     techbase: Optional[TechbaseType] = Field(description="", default=None)
     type: Optional[EquipmentTypeData] = Field(description="", default=None)
     unitSubtypes: Optional[List[UnitSubtype]] = Field(
@@ -434,42 +568,15 @@ class EquipmentItem(NullGBaseModel):
     )
     metadata: Optional[dict] = Field(description="", default=None)
     rulesLevel: Optional[int] = Field(description="", default=None)
-    item: Optional[Union[WeaponItem, OtherItem, CockpitItem, AmmoItem, HeatSinkItem, BayItem, GyroItem, EngineItem,
-    StructureItem, ConversionItem, ArmorItem, ManipulatorItem, MyomerItem, WeaponBayItem,
-    EnhancementItem]] = Field(description="", default=None)
+    item: Optional[EquipmentItemData] = Field(description="", default=None)
 
     @field_validator('item', mode='before')
     @classmethod
     def validate_item_type(cls, v: Dict, info: ValidationInfo):
         if v is not None and isinstance(v, dict):
-            if FIELD_EQUIPMENT_TYPE in info.data and isinstance(info.data[FIELD_EQUIPMENT_TYPE], int):
-                try:
-                    thisEquipmentType = EquipmentType(info.data[FIELD_EQUIPMENT_TYPE])
-                except ValueError as e:
-                    raise e
-
-                equipmentTypesMap = {
-                    EquipmentType.weapon: WeaponItem,
-                    EquipmentType.other: OtherItem,
-                    EquipmentType.armor: ArmorItem,
-                    EquipmentType.cockpit: CockpitItem,
-                    EquipmentType.structure: StructureItem,
-                    EquipmentType.engine: EngineItem,
-                    EquipmentType.conversion: ConversionItem,
-                    EquipmentType.manipulator: ManipulatorItem,
-                    EquipmentType.gyro: GyroItem,
-                    EquipmentType.ammo: AmmoItem,
-                    EquipmentType.heatsink: HeatSinkItem,
-                    EquipmentType.bay: BayItem,
-                    EquipmentType.myomer: MyomerItem,
-                    EquipmentType.enhancement: EnhancementItem,
-                    EquipmentType.weaponbay: WeaponBayItem,
-                }
-
-                try:
-                    return equipmentTypesMap[thisEquipmentType](**v)
-                except KeyError:
-                    raise ValueError('Invalid equipment type')
+            equipmentType = info.data.get(FIELD_EQUIPMENT_TYPE)
+            if isinstance(equipmentType, int):
+                return item_class_for(equipmentType).model_validate(v)
             else:
                 raise ValueError('Equipment Item Type does not exist')
         else:
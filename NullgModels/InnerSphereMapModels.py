@@ -2,6 +2,8 @@ from typing import Optional, List
 
 from pydantic import BaseModel, Field, AnyHttpUrl
 
+from NullgModels.NullGBaseModels import InternedStr, NullGBaseModel
+
 
 class Coordinates3D(BaseModel):
     """
@@ -45,7 +47,7 @@ class CoordinatesItem(BaseModel):
     """
     name: str = Field(description="", default="")
     description: str = Field(description="", default="")
-    coords: Coordinates3D = Field(description="3D coordinates", default=Coordinates3D)
+    coords: Coordinates3D = Field(description="3D coordinates", default_factory=Coordinates3D)
 
 class SizeItem(BaseModel):
     """
@@ -81,7 +83,7 @@ class StarSystemControlHistoryRecord(BaseModel):
     year: int = Field(description="Year this takes effect", default=0, examples=[3025, 3050])
     factionId: int = Field(description="Faction Id", default=0)
 
-class StarSystem(BaseModel):
+class StarSystem(NullGBaseModel):
     """
     Representation of a star system with various attributes and metadata.
 
@@ -107,10 +109,10 @@ class StarSystem(BaseModel):
     systemName: str = Field(description="", default="")
     alternateName: List[str] = Field(description="Alternate Name", default_factory=list)
     coordinates: List[CoordinatesItem] = Field(description="", default_factory=list)
-    size: SizeItem = Field(description="Size of the system", default="")
-    sarnaLink: AnyHttpUrl = Field(description="Link to Sarna", default="")
+    size: SizeItem = Field(description="Size of the system", default_factory=SizeItem)
+    sarnaLink: Optional[AnyHttpUrl] = Field(description="Link to Sarna", default=None)
     distance: float = Field(description="Distance from Sol in Light years", default=0.0)
-    starSpectralClass: str = Field(description="Spectral class of the star", default="")
+    starSpectralClass: InternedStr = Field(description="Spectral class of the star", default="")
     rechargeTime: int = Field(description="Recharge time in hours", default=0)
     planets: int = Field(description="Number of planets in the system", default=0)
     rechargeStations: List[str] = Field(description="List of recharge station locations", default_factory=list)
@@ -140,4 +142,4 @@ class InnerSphereFactionRecord(BaseModel):
     color: Optional[str] = Field(description="Faction HTML Color", default="")
     startYear: Optional[int] = Field(description="Start Year", default=0)
     endYear: Optional[int] = Field(description="End Year", default=0)
-    sarnaLink: Optional[AnyHttpUrl] = Field(description="Link to Sarna", default="")
+    sarnaLink: Optional[AnyHttpUrl] = Field(description="Link to Sarna", default=None)
@@ -13,13 +13,13 @@ class OrganizationItem(NullGBaseModel):
     id: Optional[str] = Field(description="", default=None)
     name: Optional[str] = Field(description="", default=None)
     armyListTypeId: int = Field(description="", default=0)
-    bvTotal: int = Field(description="", default=None)
-    bvUsed: int = Field(description="", default=None)
-    pvTotal: int = Field(description="", default=None)
-    pvUsed: int = Field(description="", default=None)
+    bvTotal: Optional[int] = Field(description="", default=None)
+    bvUsed: Optional[int] = Field(description="", default=None)
+    pvTotal: Optional[int] = Field(description="", default=None)
+    pvUsed: Optional[int] = Field(description="", default=None)
     combatCommand: str = Field(description="", default="")
     commandingOfficerId: str = Field(description="", default="")
-    commandSpecialAbilities: List[str] = Field(description="", default=[])
+    commandSpecialAbilities: List[str] = Field(description="", default_factory=list)
     eraId: int = Field(description="", default=0)
     experienceLevelId: int = Field(description="", default=0)
     faction: str = Field(description="", default="")
@@ -27,8 +27,8 @@ class OrganizationItem(NullGBaseModel):
     maxSize: int = Field(description="", default=0)
     militaryStructureId: int = Field(description="", default=0)
     organizationType: int = Field(description="", default=0)
-    organizationId: str = Field(description="", default=0)
-    parentOrganizationId: str = Field(description="", default=0)
+    organizationId: str = Field(description="", default="")
+    parentOrganizationId: str = Field(description="", default="")
     reputation: int = Field(description="", default=0)
     size: int = Field(description="", default=0)
     subCommand: str = Field(description="", default="")
@@ -38,12 +38,12 @@ class OrganizationItem(NullGBaseModel):
 
 class InventoryItem(NullGBaseModel):
     # Base Fields that are stored
-    id: str = Field(description="", default=None)
-    unitId: str = Field(description="", default=None)
+    id: Optional[str] = Field(description="", default=None)
+    unitId: Optional[str] = Field(description="", default=None)
     storageType: InventoryStorageType = Field(description="", default=InventoryStorageType.inventory)
-    organizationId: str = Field(description="", default=None)
-    pilotId: str = Field(description="", default=None)
+    organizationId: Optional[str] = Field(description="", default=None)
+    pilotId: Optional[str] = Field(description="", default=None)
 
     #Fields that are derived from the base fields
-    unitData: UnitData = Field(description="", default=None)
-    pilotData: PilotData = Field(description="", default=None)
+    unitData: Optional[UnitData] = Field(description="", default=None)
+    pilotData: Optional[PilotData] = Field(description="", default=None)
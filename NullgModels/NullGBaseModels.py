@@ -1,6 +1,29 @@
-from pydantic import BaseModel, ConfigDict
+import sys
+from functools import lru_cache
+from typing import Annotated, List, Union
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, TypeAdapter
+
+
+# A str that is interned after validation, for fields whose few distinct values repeat
+# across thousands of records (type names, tech ratings, spectral classes).
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(itemClass: type) -> TypeAdapter:
+    """List adapter for a model or other item class such as dict, built once per class."""
+    return TypeAdapter(List[itemClass])
 
 
 class NullGBaseModel(BaseModel):
     """ Base class for null and empty values"""
-    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+    model_config = ConfigDict(extra="ignore", populate_by_name=True, defer_build=True)
+
+    @classmethod
+    def model_validate_json_list(cls, data: Union[str, bytes]) -> List["NullGBaseModel"]:
+        """
+        Parse and validate a JSON array of these models in a single pydantic-core pass,
+        without building the intermediate list of dicts in Python first.
+        """
+        return _list_adapter(cls).validate_json(data)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import Field
 
 from NullgModels.NullGBaseModels import NullGBaseModel
@@ -9,13 +11,13 @@ class Skills(NullGBaseModel):
 
 
 class PilotData(NullGBaseModel):
-    id: str = Field(description="", default=None)
-    firstName: str = Field(description="", default=None)
-    lastName: str = Field(description="", default=None)
-    skills: Skills = Field(description="", default=None)
-    bio: str = Field(description="", default=None)
-    organizationId: str = Field(description="", default=None)
-    kills: int = Field(description="", default=None)
-    deaths: int = Field(description="", default=None)
-    imageUrl: str = Field(description="", default=None)
+    id: Optional[str] = Field(description="", default=None)
+    firstName: Optional[str] = Field(description="", default=None)
+    lastName: Optional[str] = Field(description="", default=None)
+    skills: Optional[Skills] = Field(description="", default=None)
+    bio: Optional[str] = Field(description="", default=None)
+    organizationId: Optional[str] = Field(description="", default=None)
+    kills: Optional[int] = Field(description="", default=None)
+    deaths: Optional[int] = Field(description="", default=None)
+    imageUrl: Optional[str] = Field(description="", default=None)
 
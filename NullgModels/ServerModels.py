@@ -1,89 +1,132 @@
+from types import MappingProxyType
+from typing import Annotated, ClassVar
+
 from NullgModels.EquipmentModels import EquipmentItem
 from NullgModels.HardwarModels import *
 from NullgModels.BattletechModels import *
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, ValidationError, ValidationInfo, field_validator
 
+from NullgModels.NullGBaseModels import _list_adapter
 from NullgModels.InnerSphereMapModels import InnerSphereFactionRecord, StarSystemControlHistoryRecord, StarSystem
 from NullgModels.UploadModels import UploadUnitData
 
 # -----------------------------
 # Allowed MongoDB operators
 # -----------------------------
-ALLOWED_OPERATORS = {
+ALLOWED_OPERATORS = frozenset({
     "$eq", "$ne", "$gt", "$gte", "$lt", "$lte",
     "$in", "$nin", "$regex", "$exists",
     "$and", "$or", "$nor", "$not"
-}
+})
 
-DISALLOWED_OPERATORS = {
+DISALLOWED_OPERATORS = frozenset({
     '$merge', '$out'
-}
+})
+
+# Limits on client supplied filters and pipelines: containers nested deeper than
+# MAX_FILTER_DEPTH, or more than MAX_FILTER_NODES dict entries and list items in total,
+# are rejected before they are walked any further.
+MAX_FILTER_DEPTH = 64
+MAX_FILTER_NODES = 10_000
 
 # -----------------------------
-# Recursive filter validator
+# Filter and pipeline validators
 # -----------------------------
-def validate_filter(filter_dict: Any):
-    """Recursively validate MongoDB filter structure for security.
+def _clamp(low: int, high: int) -> BeforeValidator:
+    """Clamp a paging value into [low, high] before the ge/le checks, passing None through."""
+    def clamp(v):
+        return v if v is None else low if v < low else high if v > high else v
+    return BeforeValidator(clamp)
+
+
+def _validate_tree(root: Any, inFilter: bool, maxDepth: int, maxNodes: int):
+    """
+    Walk a filter or pipeline with an explicit stack, checking operator keys and the size
+    limits. Everything below a $match stage is checked as a filter.
+    """
+    allowed = ALLOWED_OPERATORS
+    disallowed = DISALLOWED_OPERATORS
+    stack = [(root, 1, inFilter)]
+    nodes = 0
+    while stack:
+        node, depth, isFilter = stack.pop()
+        if depth > maxDepth:
+            raise ValueError(f"Filter is nested deeper than {maxDepth} levels.")
+        nodes += len(node)
+        if nodes > maxNodes:
+            raise ValueError(f"Filter has more than {maxNodes} entries.")
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key[:1] == "$":
+                    if isFilter and key not in allowed:
+                        raise ValueError(f"Operator '{key}' is not allowed.")
+                    if not isFilter and key in disallowed:
+                        raise ValueError(f"Aggregate Operator '{key}' is not allowed.")
+
+                # Visit nested dicts or lists
+                if isinstance(value, (dict, list)):
+                    stack.append((value, depth + 1, isFilter or key == "$match"))
+        else:
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    stack.append((item, depth + 1, isFilter))
+
+
+def validate_filter(filter_dict: Any, maxDepth: int = MAX_FILTER_DEPTH, maxNodes: int = MAX_FILTER_NODES):
+    """Validate MongoDB filter structure for security.
     
     Ensures that only allowed MongoDB query operators are used in filter
     expressions to prevent potentially dangerous operations.
     
     Args:
         filter_dict: MongoDB filter dictionary, list, or scalar value to validate.
+        maxDepth: Maximum nesting depth of dicts and lists.
+        maxNodes: Maximum total number of dict entries and list items.
         
     Raises:
-        ValueError: If a disallowed operator is found in the filter.
+        ValueError: If a disallowed operator is found in the filter, or the
+            filter is nested too deeply or is too large.
         
     Note:
-        This function recursively validates nested structures including
-        dictionaries and lists to ensure comprehensive security checking.
+        Nested dictionaries and lists are walked with an explicit stack rather
+        than recursion, so deeply nested client filters cannot exhaust the
+        Python stack.
     """
-    if isinstance(filter_dict, dict):
+    # Most filters are flat field equality matches, with no operators and nothing
+    # nested; those are safe after a single scan of the keys and values
+    if type(filter_dict) is dict and len(filter_dict) <= maxNodes:
         for key, value in filter_dict.items():
-            # Check for disallowed top-level operators
-            if key.startswith("$") and key not in ALLOWED_OPERATORS:
-                raise ValueError(f"Operator '{key}' is not allowed.")
-
-            # Recurse into nested dicts or lists
-            if isinstance(value, (dict, list)):
-                validate_filter(value)
-    elif isinstance(filter_dict, list):
-        for item in filter_dict:
-            validate_filter(item)
+            if key[:1] == "$" or isinstance(value, (dict, list)):
+                break
+        else:
+            return
     # Scalars (str, int, etc.) are safe
+    if isinstance(filter_dict, (dict, list)):
+        _validate_tree(filter_dict, True, maxDepth, maxNodes)
 
-def validate_pipeline(pipeline_list: Any):
-    """Recursively validate MongoDB aggregation pipeline structure for security.
+def validate_pipeline(pipeline_list: Any, maxDepth: int = MAX_FILTER_DEPTH, maxNodes: int = MAX_FILTER_NODES):
+    """Validate MongoDB aggregation pipeline structure for security.
     
     Ensures that dangerous aggregation stages like $merge and $out are not
     used in pipeline expressions.
     
     Args:
         pipeline_list: MongoDB pipeline list, dictionary, or nested structure to validate.
+        maxDepth: Maximum nesting depth of dicts and lists.
+        maxNodes: Maximum total number of dict entries and list items.
         
     Raises:
-        ValueError: If a disallowed operator is found in the pipeline.
+        ValueError: If a disallowed operator is found in the pipeline, or the
+            pipeline is nested too deeply or is too large.
         
     Note:
         This function prevents write operations in aggregation pipelines
-        that could modify the database.
+        that could modify the database. $match stages are checked like
+        validate_filter, within the same depth and size limits.
     """
-    if isinstance(pipeline_list, dict):
-        for key, value in pipeline_list.items():
-            # Check for disallowed top-level operators
-            if key.startswith("$") and key in DISALLOWED_OPERATORS:
-                raise ValueError(f"Aggregate Operator '{key}' is not allowed.")
-
-            # Recurse into nested dicts or lists
-            if isinstance(value, (dict, list)):
-                if key == "$match":
-                    validate_filter(value)
-                else:
-                    validate_pipeline(value)
-    elif isinstance(pipeline_list, list):
-        for item in pipeline_list:
-            validate_pipeline(item)
     # Scalars (str, int, etc.) are safe
+    if isinstance(pipeline_list, (dict, list)):
+        _validate_tree(pipeline_list, False, maxDepth, maxNodes)
 
 
 class SearchFilter(BaseModel):
@@ -126,6 +169,10 @@ class SearchFilter(BaseModel):
     """
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
+    # Limits applied by validate_security, tunable per deployment
+    maxDepth: ClassVar[int] = MAX_FILTER_DEPTH
+    maxNodes: ClassVar[int] = MAX_FILTER_NODES
+
     filter: Dict = Field(
         description="MongoDB query filter using standard query operators. "
                    "Supports $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin, $regex, "
@@ -146,14 +193,14 @@ class SearchFilter(BaseModel):
             {"fullName": 1, "id": 1, "bv": 1},
             {"_id": 0, "name": 1, "mass": 1}
         ])
-    page: Optional[int] = Field(
+    page: Annotated[Optional[int], _clamp(1, 1000)] = Field(
         description="Page number to retrieve (1-indexed). Used for pagination of results.",
         default=1,
         ge=1,
         le=1000,
         examples=[1, 2, 3]
     )
-    itemsPerPage: Optional[int] = Field(
+    itemsPerPage: Annotated[Optional[int], _clamp(1, 100)] = Field(
         description="Maximum number of items to return per page. Controls page size for pagination.",
         default=50,
         ge=10,
@@ -161,16 +208,6 @@ class SearchFilter(BaseModel):
         examples=[10, 20, 50, 100]
     )
 
-    @field_validator("itemsPerPage", mode="before")
-    @classmethod
-    def validate_items_per_page(cls, v):
-        return max(min(v, 100), 1) if v is not None else v
-
-    @field_validator("page", mode="before")
-    @classmethod
-    def validate_page(cls, v):
-        return max(min(v, 1000), 1) if v is not None else v
-
     def validate_security(self):
         """Validate the filter for security compliance.
         
@@ -178,9 +215,10 @@ class SearchFilter(BaseModel):
         to prevent potentially dangerous operations.
         
         Raises:
-            ValueError: If the filter contains disallowed operators.
+            ValueError: If the filter contains disallowed operators, or is
+                deeper or larger than maxDepth/maxNodes.
         """
-        validate_filter(self.filter)
+        validate_filter(self.filter, self.maxDepth, self.maxNodes)
 
 
 class PipelineFilter(BaseModel):
@@ -225,6 +263,10 @@ class PipelineFilter(BaseModel):
     """
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
+    # Limits applied by validate_security, tunable per deployment
+    maxDepth: ClassVar[int] = MAX_FILTER_DEPTH
+    maxNodes: ClassVar[int] = MAX_FILTER_NODES
+
     pipeline: List[Dict[str, Any]] = Field(
         description="MongoDB aggregation pipeline as a list of stage dictionaries. "
                    "Each stage performs a specific operation (match, group, sort, project, etc.). "
@@ -235,29 +277,19 @@ class PipelineFilter(BaseModel):
             [{"$unwind": "$factions"}, {"$group": {"_id": "$factions", "avgBV": {"$avg": "$bv"}}}]
         ]
     )
-    page: Optional[int] = Field(
+    page: Annotated[Optional[int], _clamp(1, 100)] = Field(
         description="Page number for pagination of aggregation results (1-indexed).",
         default=1,
         ge=1,
         le=1000
     )
-    itemsPerPage: Optional[int] = Field(
+    itemsPerPage: Annotated[Optional[int], _clamp(1, 100)] = Field(
         description="Maximum number of aggregation results to return.",
         default=50,
         ge=1,
         le=100
     )
 
-    @field_validator("itemsPerPage", mode="before")
-    @classmethod
-    def validate_items_per_page(cls, v):
-        return max(min(v, 100), 1) if v is not None else v
-
-    @field_validator("page", mode="before")
-    @classmethod
-    def validate_page(cls, v):
-        return max(min(v, 100), 1) if v is not None else v
-
     def validate_security(self):
         """Validate the pipeline for security compliance.
         
@@ -265,9 +297,20 @@ class PipelineFilter(BaseModel):
         in the aggregation pipeline.
         
         Raises:
-            ValueError: If the pipeline contains disallowed operators.
+            ValueError: If the pipeline contains disallowed operators, or is
+                deeper or larger than maxDepth/maxNodes.
         """
-        validate_pipeline(self.pipeline)
+        validate_pipeline(self.pipeline, self.maxDepth, self.maxNodes)
+
+
+# Result item models by the itemClass name a DataResultItem reports for them
+RESULT_ITEM_CLASSES = MappingProxyType({
+    **{itemClass.__name__: itemClass for itemClass in (
+        EraItem, EquipmentItem, UnitData, BasicItem, MULUnitItem, BoxsetItem, ElementData,
+        UnitDataExtended, StarSystem, StarSystemControlHistoryRecord, InnerSphereFactionRecord)},
+    'Dict': dict,
+    'dict': dict,
+})
 
 
 class DataResultItem(BaseModel):
@@ -318,6 +361,12 @@ class DataResultItem(BaseModel):
         ...     status="failure",
         ...     message="Invalid query operator"
         ... )
+
+    Note:
+        Model instances passed as items are kept as they are, not validated
+        again, so building a response from already built models is cheap.
+        Raw dicts are validated as the class named by itemClass; a list that
+        does not fit that class is validated against the full union instead.
     """
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
@@ -359,7 +408,7 @@ class DataResultItem(BaseModel):
     ] = Field(
         description="List of result items. Type varies based on the query endpoint. "
                    "Check itemClass field to determine the actual type of items.",
-        default=[]
+        default_factory=list
     )
     status: str = Field(
         description="Operation status indicator. Common values: 'success', 'failure', 'not completed'.",
@@ -370,6 +419,20 @@ class DataResultItem(BaseModel):
         default="Empty results"
     )
 
+    @field_validator('items', mode='wrap')
+    @classmethod
+    def validate_items(cls, v: Any, handler, info: ValidationInfo):
+        # Validate straight to the class named by itemClass instead of trying every
+        # member of the union on each item; unknown names, and lists that don't fit
+        # the named class, fall back to the union
+        itemClass = info.data.get('itemClass')
+        if itemClass in RESULT_ITEM_CLASSES:
+            try:
+                return _list_adapter(RESULT_ITEM_CLASSES[itemClass]).validate_python(v)
+            except ValidationError:
+                pass
+        return handler(v)
+
 
 class ServerResponseItem(BaseModel):
     """Generic server response wrapper for non-typed results.
@@ -429,7 +492,7 @@ class ServerResponseItem(BaseModel):
     )
     items: List[Dict] = Field(
         description="List of result dictionaries. Structure varies based on query or aggregation.",
-        default=[]
+        default_factory=list
     )
     status: str = Field(
         description="Operation status: 'success', 'failure', etc.",
@@ -473,7 +536,7 @@ class UploadItem(BaseModel):
                    "Must match the actual type of objects in the items list.",
         default=""
     )
-    items: List[Union[UploadUnitData]] = Field(
+    items: List[UploadUnitData] = Field(
         description="List of items to upload. Type should match the itemClass field.",
-        default=[]
+        default_factory=list
     )
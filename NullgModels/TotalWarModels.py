@@ -23,7 +23,7 @@ from typing import Optional, List, Dict, Literal, Union
 from pydantic import Field, computed_field
 
 from NullgModels.EquipmentModels import EquipmentItem
-from NullgModels.NullGBaseModels import NullGBaseModel
+from NullgModels.NullGBaseModels import InternedStr, NullGBaseModel
 from NullgModels.NullGEnums import TurretType, JumpJetType, TotalWarEquipmentItemType, MotionType, WeightClassType, \
     RoleType, EquipmentType
 
@@ -56,7 +56,7 @@ class TotalWarBasicComponent(NullGBaseModel):
         default=None,
         examples=["", ""]
     )
-    techbase: Optional[str] = Field(
+    techbase: Optional[InternedStr] = Field(
         description="Technology base for the item.",
         default=None,
         examples=["Inner Sphere", "Clan", "Mixed"]
@@ -554,7 +554,7 @@ class TotalWarUnitDataBase(NullGBaseModel):
         default=None,
         examples=["TechManual", "TRO:3025", "TRO:3050U, p.123", "Rec Guide:12"]
     )
-    techbase: Optional[str] = Field(
+    techbase: Optional[InternedStr] = Field(
         description="Technology base: 'Inner Sphere', 'Clan', or 'Mixed'. "
                     "Determines construction rules and equipment availability.",
         default=None,
@@ -2,8 +2,8 @@
 from typing import List, Union
 
 import requests
-from pydantic import TypeAdapter
 from NullG_Constants import *
+from NullgModels.NullGBaseModels import _list_adapter
 from NullgModels.NullGEnums import EquipmentType
 
 from NullgModels.ServerModels import ServerResponseItem, SearchFilter
@@ -430,7 +430,7 @@ class NullGConnector:
             )
         items = results.items
         itemClass = self._get_item_class(results.itemClass)
-        adapter = TypeAdapter(List[itemClass])
+        adapter = _list_adapter(itemClass)
         models: List[itemClass] = adapter.validate_python(items)
         return models
 
@@ -1,7 +1,8 @@
 # utils/introspection.py
-from typing import Any, List, get_origin, get_args, Dict
+from functools import lru_cache
+from typing import Any, List, get_origin, get_args, Dict, Annotated, Tuple, Union
 from pydantic import BaseModel
-from NullgModels.FieldMetadata import FieldMetadata
+from NullgModels.FieldMetadata import FieldMetadata, MetadataResponse
 
 
 DEFAULT_OPERATORS = {
@@ -19,7 +20,7 @@ def get_type_name(py_type: Any) -> str:
     args = get_args(py_type)
     if isinstance(args, tuple) and len(args) > 0:
         py_type = args[0]
-    if get_origin(py_type) in (list, List):
+    if get_origin(py_type) in (list, List, tuple):
         arg = get_args(py_type)[0] if get_args(py_type) else "any"
         return f"array[{get_type_name(arg)}]"
     elif get_origin(py_type) in (dict, Dict):
@@ -42,6 +43,19 @@ def get_type_name(py_type: Any) -> str:
     return str(py_type)
 
 
+def unwrap_annotated(types: tuple) -> tuple:
+    """Replace Annotated wrappers, including tagged unions, with the plain types they hold."""
+    unwrapped = []
+    for arg in types:
+        if get_origin(arg) is Annotated:
+            arg = get_args(arg)[0]
+        if get_origin(arg) is Union:
+            unwrapped.extend(unwrap_annotated(get_args(arg)))
+        else:
+            unwrapped.append(arg)
+    return tuple(unwrapped)
+
+
 def walk_model_fields(model: type[BaseModel], prefix: str = "", category: str = None) -> List[FieldMetadata]:
     """Recursively collect nested field metadata (Pydantic v2-safe)."""
     raw_fields: List[FieldMetadata] = []
@@ -64,7 +78,7 @@ def walk_model_fields(model: type[BaseModel], prefix: str = "", category: str =
         field_args = get_args(field.annotation)
         if not field_args:
             field_args = (field.annotation,)
-        for arg in field_args:
+        for arg in unwrap_annotated(field_args):
             if arg is type(None):
                 continue
             # recurse into submodels
@@ -92,3 +106,17 @@ def walk_model_fields(model: type[BaseModel], prefix: str = "", category: str =
             included_fields.add(field.name)
             fields.append(field)
     return fields
+
+
+@lru_cache(maxsize=None)
+def _field_metadata_entries(model: type[BaseModel]) -> Tuple[Dict[str, Any], ...]:
+    """The walked fields of a model as plain values, walked once per model class."""
+    return tuple(field.model_dump() for field in walk_model_fields(model))
+
+
+def field_metadata_for(model: type[BaseModel]) -> MetadataResponse:
+    """
+    Field metadata for a model. The fields are walked once per model class, and every call
+    builds a new response from them, so callers can change it freely.
+    """
+    return MetadataResponse(fields=_field_metadata_entries(model))